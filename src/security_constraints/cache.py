@@ -0,0 +1,98 @@
+"""Module for caching fetched vulnerabilities on disk between runs."""
+import contextlib
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from security_constraints.common import (
+    SecurityVulnerability,
+    SecurityVulnerabilityDatabaseAPI,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_cache_dir() -> Path:
+    """Return the directory in which cached vulnerabilities are stored.
+
+    Follows the XDG Base Directory Specification, i.e. uses
+    $XDG_CACHE_HOME if it is set and ~/.cache otherwise.
+
+    """
+    cache_home: str = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "security-constraints"
+
+
+class CachingAPI(SecurityVulnerabilityDatabaseAPI):
+    """Decorator for an API which caches its vulnerabilities on disk.
+
+    The vulnerabilities are stored as json in the cache directory, in a file
+    whose name is derived from the name of the database and the given key.
+    As long as that file is younger than ttl seconds, it is used instead
+    of fetching the vulnerabilities from the wrapped API.
+
+    """
+
+    def __init__(
+        self,
+        api: SecurityVulnerabilityDatabaseAPI,
+        ttl: int,
+        key: str = "",
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        self.api = api
+        self.ttl = ttl
+        digest: str = hashlib.sha256(
+            f"{api.get_database_name()}:{key}".encode("utf-8")
+        ).hexdigest()
+        self.cache_file: Path = (cache_dir or get_cache_dir()) / f"{digest}.json"
+
+    def get_database_name(self) -> str:
+        return self.api.get_database_name()
+
+    def get_vulnerabilities(self) -> List[SecurityVulnerability]:
+        """Return cached vulnerabilities, or fetch them if the cache is stale."""
+        vulnerabilities: Optional[List[SecurityVulnerability]] = self._read_cache()
+        if vulnerabilities is None:
+            vulnerabilities = self.api.get_vulnerabilities()
+            self._write_cache(vulnerabilities)
+        return vulnerabilities
+
+    def _read_cache(self) -> Optional[List[SecurityVulnerability]]:
+        try:
+            age: float = time.time() - self.cache_file.stat().st_mtime
+        except OSError:
+            return None
+        if age >= self.ttl:
+            LOGGER.debug("Cache file %s is stale.", self.cache_file)
+            return None
+        try:
+            with open(self.cache_file, mode="r") as fh:
+                return [SecurityVulnerability(**v) for v in json.load(fh)]
+        except (OSError, ValueError, TypeError) as error:
+            LOGGER.warning("Could not read cache file %s: %s", self.cache_file, error)
+            return None
+
+    def _write_cache(self, vulnerabilities: List[SecurityVulnerability]) -> None:
+        # Write to a unique temporary file and move it into place, so that
+        # concurrent runs sharing the cache never see a half-written file.
+        temp_file: Optional[str] = None
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=self.cache_file.parent, suffix=".tmp", delete=False
+            ) as fh:
+                temp_file = fh.name
+                json.dump([dataclasses.asdict(v) for v in vulnerabilities], fh)
+            os.replace(temp_file, self.cache_file)
+        except OSError as error:
+            LOGGER.warning("Could not write cache file %s: %s", self.cache_file, error)
+            if temp_file is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(temp_file)
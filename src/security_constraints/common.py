@@ -2,6 +2,7 @@
 import abc
 import argparse
 import dataclasses
+import sys
 from typing import IO, Dict, List, Optional
 
 
@@ -15,6 +16,7 @@ class ArgumentNamespace(argparse.Namespace):
     ignore_ids: List[str]
     config: Optional[str]
     severities: List[str]
+    cache_ttl: int
 
 
 class SecurityConstraintsError(Exception):
@@ -89,11 +91,20 @@ class SecurityVulnerability:
 
     """
 
+    # Many of these are created when fetching vulnerabilities, so avoid
+    # a per-instance __dict__ to keep them compact.
+    __slots__ = ("name", "identifier", "package", "vulnerable_range")
+
     name: str
     identifier: str
     package: str
     vulnerable_range: str
 
+    def __post_init__(self) -> None:
+        # Many vulnerabilities share a package, and interned names compare
+        # by identity when sorting on package.
+        self.package = sys.intern(self.package)
+
     def __str__(self) -> str:
         return self.name
 
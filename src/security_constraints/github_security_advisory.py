@@ -1,7 +1,6 @@
 """Module for fetching vulnerabilities from the GitHub Security Advisory."""
 import logging
 import os
-import string
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -15,13 +14,13 @@ from security_constraints.common import (
 
 LOGGER = logging.getLogger(__name__)
 
-QUERY_TEMPLATE = string.Template(
-    "{"
+QUERY = (
+    "query($first: Int!, $severities: [SecurityAdvisorySeverity!], $after: String) {"
     "securityVulnerabilities("
     " first: $first"
-    " ecosystem:PIP"
-    " severities:[$severities]"
-    " $additional"
+    " ecosystem: PIP"
+    " severities: $severities"
+    " after: $after"
     ") {"
     "    totalCount"
     "    pageInfo { endCursor startCursor hasNextPage }"
@@ -65,7 +64,11 @@ class GithubSecurityAdvisoryAPI(SecurityVulnerabilityDatabaseAPI):
         return "Github Security Advisory"
 
     def get_vulnerabilities(self) -> List[SecurityVulnerability]:
-        """Fetch all CRITICAL vulnerabilities from GitHub Security Advisory."""
+        """Fetch vulnerabilities of the given severities from GitHub Security Advisory.
+
+        All severities are requested in a single paginated GraphQL query.
+
+        """
         after: Optional[str] = None
         vulnerabilities: List[SecurityVulnerability] = []
         more_data_exists = True
@@ -105,15 +108,15 @@ class GithubSecurityAdvisoryAPI(SecurityVulnerabilityDatabaseAPI):
     def _do_graphql_request(
         self, severities: List[str], after: Optional[str] = None
     ) -> Any:
-        query = QUERY_TEMPLATE.substitute(
-            first=100,
-            severities=",".join(severities),
-            additional=f'after:"{after}"' if after is not None else "",
-        )
+        variables: Dict[str, Any] = {
+            "first": 100,
+            "severities": [severity.upper() for severity in severities],
+            "after": after,
+        }
         response: requests.Response = self._session.post(
             url=self.URL,
             headers={"Authorization": f"bearer {self._token}"},
-            json={"query": query},
+            json={"query": QUERY, "variables": variables},
         )
         try:
             response.raise_for_status()
@@ -1,18 +1,33 @@
 """Main module."""
 import argparse
+import concurrent.futures
+import itertools
 import logging
+import operator
+import re
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 
 if sys.version_info >= (3, 8):
     from importlib.metadata import version
 else:
     from importlib_metadata import version
 
-from typing import IO, List, Optional, Sequence
-
-import yaml
+from types import ModuleType
+from typing import (
+    IO,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
+from security_constraints.cache import CachingAPI
 from security_constraints.common import (
     ArgumentNamespace,
     Configuration,
@@ -25,42 +40,84 @@ from security_constraints.github_security_advisory import GithubSecurityAdvisory
 
 LOGGER = logging.getLogger(__name__)
 
+APP_NAME = "security-constraints"
+APP_VERSION: str = version(APP_NAME)
+
+MAX_FETCH_WORKERS = 8
+
+# Maps the operator of a vulnerable version range to the operator
+# of the specifier for the corresponding safe versions.
+SAFE_SPECIFIER_OPERATORS: Dict[str, str] = {
+    "=": "!=",
+    "<=": ">",
+    "<": ">=",
+    ">=": "<",
+}
+
+PIP_FRIENDLY_SPECIFIER = re.compile(r"[<>=!]{1,2}\s*\d+(?:\.\d+)*")
+
 
 def get_security_vulnerability_database_apis(
     severities: Optional[List[str]] = None,
+    cache_ttl: int = 0,
 ) -> List[SecurityVulnerabilityDatabaseAPI]:
-    """Return the APIs to use for fetching vulnerabilities."""
-    return [GithubSecurityAdvisoryAPI(severities=severities)]
+    """Return the APIs to use for fetching vulnerabilities.
+
+    If cache_ttl is positive, the APIs are wrapped so that fetched
+    vulnerabilities are cached on disk for that many seconds.
+
+    """
+    apis: List[SecurityVulnerabilityDatabaseAPI] = [
+        GithubSecurityAdvisoryAPI(severities=severities)
+    ]
+    if cache_ttl > 0:
+        key: str = ",".join(sorted(s.upper() for s in severities or []))
+        apis = [CachingAPI(api, ttl=cache_ttl, key=key) for api in apis]
+    return apis
 
 
 def fetch_vulnerabilities(
     apis: Sequence[SecurityVulnerabilityDatabaseAPI],
 ) -> List[SecurityVulnerability]:
-    """Use apis to fetch and return vulnerabilities."""
-    vulnerabilities: List[SecurityVulnerability] = []
-    for api in apis:
+    """Use apis to fetch and return vulnerabilities.
+
+    The apis are queried concurrently, but the returned vulnerabilities
+    are in the same order as the apis.
+
+    """
+    if not apis:
+        return []
+
+    def fetch(api: SecurityVulnerabilityDatabaseAPI) -> List[SecurityVulnerability]:
         LOGGER.debug("Fetching vulnerabilities from %s...", api.get_database_name())
-        vulnerabilities.extend(api.get_vulnerabilities())
-    return vulnerabilities
+        return api.get_vulnerabilities()
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(MAX_FETCH_WORKERS, len(apis))
+    ) as executor:
+        return list(itertools.chain.from_iterable(executor.map(fetch, apis)))
 
 
 def filter_vulnerabilities(
-    config: Configuration, vulnerabilities: List[SecurityVulnerability]
-) -> List[SecurityVulnerability]:
-    """Filter out vulnerabilities that should be ignored and return the rest."""
-    if config.ignore_ids:
+    config: Configuration, vulnerabilities: Iterable[SecurityVulnerability]
+) -> Iterator[SecurityVulnerability]:
+    """Filter out vulnerabilities that should be ignored and yield the rest.
+
+    Filtering is done lazily, so that the result can be passed straight
+    to sort_vulnerabilities without building an intermediate list.
+
+    """
+    ignored: FrozenSet[str] = frozenset(config.ignore_ids)
+    if ignored:
         LOGGER.debug("Applying ignore-ids...")
-        vulnerabilities = [
-            v for v in vulnerabilities if v.identifier not in config.ignore_ids
-        ]
-    return vulnerabilities
+    return (v for v in vulnerabilities if v.identifier not in ignored)
 
 
 def sort_vulnerabilities(
-    vulnerabilities: List[SecurityVulnerability],
+    vulnerabilities: Iterable[SecurityVulnerability],
 ) -> List[SecurityVulnerability]:
     """Sort vulnerabilities into the order they should appear in the constraints."""
-    return sorted(vulnerabilities, key=lambda v: v.package)
+    return sorted(vulnerabilities, key=operator.attrgetter("package"))
 
 
 def get_safe_version_constraints(
@@ -83,14 +140,10 @@ def get_safe_version_constraints(
     else:
         vulnerable_spec = vulnerability.vulnerable_range.strip()
 
-    if vulnerable_spec.startswith("= "):
-        safe_specs.append(f"!={vulnerable_spec[2:]}")
-    elif vulnerable_spec.startswith("<= "):
-        safe_specs.append(f">{vulnerable_spec[3:]}")
-    elif vulnerable_spec.startswith("< "):
-        safe_specs.append(f">={vulnerable_spec[2:]}")
-    elif vulnerable_spec.startswith(">= "):
-        safe_specs.append(f"<{vulnerable_spec[3:]}")
+    operator_, _, vulnerable_version = vulnerable_spec.partition(" ")
+    safe_operator: Optional[str] = SAFE_SPECIFIER_OPERATORS.get(operator_)
+    if safe_operator is not None:
+        safe_specs.append(f"{safe_operator}{vulnerable_version}")
     return PackageConstraints(
         package=vulnerability.package,
         specifiers=safe_specs,
@@ -109,28 +162,36 @@ def are_constraints_pip_friendly(constraints: PackageConstraints) -> bool:
     for part in constraints.specifiers:
         if part.startswith("="):
             continue
-        version = part.strip("<>=! ")
-        if not version.replace(".", "").isnumeric():
-            LOGGER.debug(
-                "Pip-unfriendly constraint '%s' (%s) -> ignore.",
-                part,
-                constraints.package,
-            )
+        if not PIP_FRIENDLY_SPECIFIER.fullmatch(part):
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "Pip-unfriendly constraint '%s' (%s) -> ignore.",
+                    part,
+                    constraints.package,
+                )
             return False
     return True
 
 
 def create_header(
-    apis: Sequence[SecurityVulnerabilityDatabaseAPI], config: Configuration
+    apis: Sequence[SecurityVulnerabilityDatabaseAPI], config_dict: Dict
 ) -> str:
-    """Create the comment header which goes at the top of the output."""
-    timestamp: str = f"{datetime.utcnow().isoformat()}Z"
+    """Create the comment header which goes at the top of the output.
+
+    Args:
+        apis: The APIs which the vulnerabilities were fetched from.
+        config_dict: The application configuration, as returned by
+            Configuration.to_dict().
+
+    """
+    timestamp: str = (
+        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    )
     sources: List[str] = [api.get_database_name() for api in apis]
-    app_name: str = "security-constraints"
     lines: List[str] = [
-        f"Generated by {app_name} {version(app_name)} on {timestamp}",
+        f"Generated by {APP_NAME} {APP_VERSION} on {timestamp}",
         f"Data sources: {', '.join(sources)}",
-        f"Configuration: {config.to_dict()}",
+        f"Configuration: {config_dict}",
     ]
     return "\n".join([f"# {line}" for line in lines])
 
@@ -145,12 +206,11 @@ def format_constraints_file_line(
         vulnerability: The vulnerability tackled by the constraints.
 
     """
-    if constraints.package != vulnerability.package:
-        raise AssertionError(
-            "Constraints and vulnerability are for different packages!"
-            " This suggests a programming error!"
-        )
-    return f"{constraints}" f"  # {vulnerability.name} (ID: {vulnerability.identifier})"
+    assert constraints.package == vulnerability.package, (
+        "Constraints and vulnerability are for different packages!"
+        " This suggests a programming error!"
+    )
+    return f"{constraints}  # {vulnerability.name} (ID: {vulnerability.identifier})"
 
 
 def get_args() -> ArgumentNamespace:
@@ -215,9 +275,36 @@ def get_args() -> ArgumentNamespace:
             " Can also be given as 'severities' in config file."
         ),
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        action="store",
+        default=0,
+        help=(
+            "Number of seconds to cache fetched vulnerabilities on disk"
+            " (in $XDG_CACHE_HOME/security-constraints). 0 disables the cache."
+        ),
+    )
     return parser.parse_args(namespace=ArgumentNamespace())
 
 
+def _yaml() -> Tuple[ModuleType, Type, Type]:
+    """Import yaml and return it along with the safe loader and dumper to use.
+
+    PyYAML is imported lazily since it is slow to import and only needed
+    for reading or dumping config files. The libyaml-based loader and
+    dumper are preferred when PyYAML was built with libyaml.
+
+    """
+    import yaml
+
+    return (
+        yaml,
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    )
+
+
 def get_config(config_file: Optional[str]) -> Configuration:
     """Return configuration read from config_file.
 
@@ -227,8 +314,9 @@ def get_config(config_file: Optional[str]) -> Configuration:
     if config_file is None:
         return Configuration()
 
+    yaml, loader, _ = _yaml()
     with open(config_file, mode="r") as fh:
-        return Configuration.from_dict(yaml.safe_load(fh))
+        return Configuration.from_dict(yaml.load(fh, Loader=loader))
 
 
 def setup_logging(debug: bool = False) -> None:
@@ -242,11 +330,16 @@ def main() -> int:
         The program exit code as an integer.
 
     """
+    if sys.argv[1:] in (["-v"], ["--version"]):
+        # Fast path which avoids building the argument parser.
+        print(APP_VERSION)
+        return 0
+
     output: Optional[IO] = None
     try:
         args = get_args()
         if args.version:
-            print(version("security-constraints"))
+            print(APP_VERSION)
             return 0
         setup_logging(debug=args.debug)
         output = args.output
@@ -258,28 +351,34 @@ def main() -> int:
         config.ignore_ids.extend(sorted(args.ignore_ids))
         config.severities.extend(sorted(args.severities))
 
+        config_dict: Dict = config.to_dict()
+
         if args.dump_config:
-            yaml.safe_dump(config.to_dict(), stream=sys.stdout)
+            yaml, _, dumper = _yaml()
+            yaml.dump(config_dict, stream=sys.stdout, Dumper=dumper)
             return 0
 
         apis: List[
             SecurityVulnerabilityDatabaseAPI
-        ] = get_security_vulnerability_database_apis(severities=args.severities)
+        ] = get_security_vulnerability_database_apis(
+            severities=args.severities, cache_ttl=args.cache_ttl
+        )
 
-        vulnerabilities: List[SecurityVulnerability] = fetch_vulnerabilities(apis)
-        vulnerabilities = filter_vulnerabilities(config, vulnerabilities)
-        vulnerabilities = sort_vulnerabilities(vulnerabilities)
+        vulnerabilities: List[SecurityVulnerability] = sort_vulnerabilities(
+            filter_vulnerabilities(config, fetch_vulnerabilities(apis))
+        )
 
         LOGGER.debug("Writing constraints...")
-        output.write(f"{create_header(apis, config)}\n")
+        lines: List[str] = [f"{create_header(apis, config_dict)}\n"]
         for vulnerability in vulnerabilities:
             constraints: PackageConstraints = get_safe_version_constraints(
                 vulnerability
             )
             if are_constraints_pip_friendly(constraints):
-                output.write(
+                lines.append(
                     f"{format_constraints_file_line(constraints, vulnerability)}\n"
                 )
+        output.writelines(lines)
     except SecurityConstraintsError as error:
         LOGGER.error(error)
         return 1
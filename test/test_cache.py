@@ -0,0 +1,110 @@
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from security_constraints.cache import CachingAPI, get_cache_dir
+from security_constraints.common import (
+    SecurityVulnerability,
+    SecurityVulnerabilityDatabaseAPI,
+)
+
+VULNERABILITIES = [
+    SecurityVulnerability(
+        name="CVE-1",
+        identifier="GHSA-1",
+        package="pystuff",
+        vulnerable_range="< 1.0",
+    ),
+    SecurityVulnerability(
+        name="CVE-2",
+        identifier="GHSA-2",
+        package="pybanana",
+        vulnerable_range="= 2.0",
+    ),
+]
+
+
+@pytest.fixture(name="mock_api")
+def fixture_mock_api() -> Mock:
+    return Mock(
+        spec=SecurityVulnerabilityDatabaseAPI,
+        get_database_name=Mock(return_value="FakeDB"),
+        get_vulnerabilities=Mock(return_value=VULNERABILITIES),
+    )
+
+
+def test_get_cache_dir(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert get_cache_dir() == tmp_path / "security-constraints"
+
+
+def test_get_cache_dir__no_xdg(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr("pathlib.Path.home", Mock(return_value=tmp_path))
+    assert get_cache_dir() == tmp_path / ".cache" / "security-constraints"
+
+
+def test_get_database_name(mock_api, tmp_path) -> None:
+    api = CachingAPI(mock_api, ttl=60, cache_dir=tmp_path)
+    assert api.get_database_name() == "FakeDB"
+
+
+def test_cache_file_depends_on_key(mock_api, tmp_path) -> None:
+    api_1 = CachingAPI(mock_api, ttl=60, key="CRITICAL", cache_dir=tmp_path)
+    api_2 = CachingAPI(mock_api, ttl=60, key="CRITICAL,HIGH", cache_dir=tmp_path)
+    assert api_1.cache_file != api_2.cache_file
+    assert api_1.cache_file.parent == tmp_path
+
+
+def test_get_vulnerabilities__cache_miss(mock_api, tmp_path) -> None:
+    api = CachingAPI(mock_api, ttl=60, cache_dir=tmp_path / "sub")
+    assert api.get_vulnerabilities() == VULNERABILITIES
+    mock_api.get_vulnerabilities.assert_called_once_with()
+    with open(api.cache_file) as fh:
+        assert [SecurityVulnerability(**v) for v in json.load(fh)] == VULNERABILITIES
+    assert list(api.cache_file.parent.iterdir()) == [api.cache_file]
+
+
+def test_get_vulnerabilities__failed_replace(monkeypatch, mock_api, tmp_path) -> None:
+    monkeypatch.setattr("os.replace", Mock(side_effect=OSError("intentional")))
+    api = CachingAPI(mock_api, ttl=60, cache_dir=tmp_path)
+    assert api.get_vulnerabilities() == VULNERABILITIES
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_get_vulnerabilities__cache_hit(mock_api, tmp_path) -> None:
+    _ = CachingAPI(mock_api, ttl=60, cache_dir=tmp_path).get_vulnerabilities()
+    mock_api.get_vulnerabilities.reset_mock()
+    assert (
+        CachingAPI(mock_api, ttl=60, cache_dir=tmp_path).get_vulnerabilities()
+        == VULNERABILITIES
+    )
+    mock_api.get_vulnerabilities.assert_not_called()
+
+
+def test_get_vulnerabilities__cache_stale(mock_api, tmp_path) -> None:
+    api = CachingAPI(mock_api, ttl=60, cache_dir=tmp_path)
+    _ = api.get_vulnerabilities()
+    expired: float = time.time() - 61
+    os.utime(api.cache_file, (expired, expired))
+    mock_api.get_vulnerabilities.reset_mock()
+    assert api.get_vulnerabilities() == VULNERABILITIES
+    mock_api.get_vulnerabilities.assert_called_once_with()
+
+
+def test_get_vulnerabilities__corrupt_cache(mock_api, tmp_path) -> None:
+    api = CachingAPI(mock_api, ttl=60, cache_dir=tmp_path)
+    api.cache_file.write_text("{not json")
+    assert api.get_vulnerabilities() == VULNERABILITIES
+    mock_api.get_vulnerabilities.assert_called_once_with()
+
+
+def test_get_vulnerabilities__unwritable_cache(mock_api, tmp_path) -> None:
+    not_a_dir: Path = tmp_path / "file"
+    not_a_dir.write_text("")
+    api = CachingAPI(mock_api, ttl=60, cache_dir=not_a_dir)
+    assert api.get_vulnerabilities() == VULNERABILITIES
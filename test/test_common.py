@@ -48,3 +48,26 @@ def test_security_vulnerability_str() -> None:
         vulnerable_range="<3.2.1",
     )
     assert str(vulnerability) == "vulnerability-name"
+
+
+def test_security_vulnerability_has_no_dict() -> None:
+    vulnerability = SecurityVulnerability(
+        name="vulnerability-name",
+        identifier="MY-ID",
+        package="pystuff",
+        vulnerable_range="<3.2.1",
+    )
+    assert not hasattr(vulnerability, "__dict__")
+
+
+def test_security_vulnerability_package_is_interned() -> None:
+    vulnerabilities = [
+        SecurityVulnerability(
+            name=f"vulnerability-{i}",
+            identifier=f"MY-ID-{i}",
+            package="".join(["py", "stuff"]),
+            vulnerable_range="<3.2.1",
+        )
+        for i in range(2)
+    ]
+    assert vulnerabilities[0].package is vulnerabilities[1].package
@@ -1,6 +1,7 @@
 from typing import Dict, List
 
 import pytest
+import requests
 
 from security_constraints.github_security_advisory import (
     FailedPrerequisitesError,
@@ -88,7 +89,11 @@ def test_get_vulnerabilities(github_token, requests_mock) -> None:
             }
             for request_index in range(3)
         ],
-        request_headers={"Authorization": f"bearer {github_token}"},
+        request_headers={
+            "Authorization": f"bearer {github_token}",
+            # Compressed responses are negotiated by requests' defaults.
+            "Accept-Encoding": requests.utils.default_headers()["Accept-Encoding"],
+        },
     )
 
     api = GithubSecurityAdvisoryAPI()
@@ -96,6 +101,38 @@ def test_get_vulnerabilities(github_token, requests_mock) -> None:
 
     assert vulnerabilities == expected_vulnerabilities
     assert requests_mock.call_count == 3
+    assert [r.json()["variables"] for r in requests_mock.request_history] == [
+        {"first": 100, "severities": ["CRITICAL"], "after": after}
+        for after in (None, cursors[1], cursors[2])
+    ]
+
+
+def test_get_vulnerabilities__severities(github_token, requests_mock) -> None:
+    requests_mock.post(
+        "https://api.github.com/graphql",
+        json={
+            "data": {
+                "securityVulnerabilities": {
+                    "totalCount": 0,
+                    "pageInfo": {
+                        "endCursor": None,
+                        "startCursor": None,
+                        "hasNextPage": False,
+                    },
+                    "nodes": [],
+                }
+            }
+        },
+    )
+
+    api = GithubSecurityAdvisoryAPI(severities=["critical", "HIGH"])
+    assert api.get_vulnerabilities() == []
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.json()["variables"] == {
+        "first": 100,
+        "severities": ["CRITICAL", "HIGH"],
+        "after": None,
+    }
 
 
 def test_get_vulnerabilities__http_error(github_token, requests_mock) -> None:
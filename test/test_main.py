@@ -3,7 +3,7 @@ import datetime
 import logging
 import sys
 from pathlib import Path
-from typing import List, Type
+from typing import Dict, List, Type
 from unittest.mock import Mock, call, create_autospec
 
 import freezegun
@@ -39,6 +39,20 @@ def test_get_security_vulnerability_database_apis(monkeypatch) -> None:
     assert get_security_vulnerability_database_apis() == [mock.return_value]
 
 
+def test_get_security_vulnerability_database_apis__cache(monkeypatch) -> None:
+    mock = Mock()
+    mock_caching_api = Mock()
+    monkeypatch.setattr("security_constraints.main.GithubSecurityAdvisoryAPI", mock)
+    monkeypatch.setattr("security_constraints.main.CachingAPI", mock_caching_api)
+    assert get_security_vulnerability_database_apis(
+        severities=["high", "CRITICAL"], cache_ttl=600
+    ) == [mock_caching_api.return_value]
+    mock.assert_called_once_with(severities=["high", "CRITICAL"])
+    mock_caching_api.assert_called_once_with(
+        mock.return_value, ttl=600, key="CRITICAL,HIGH"
+    )
+
+
 @pytest.mark.parametrize(
     "vulnerability, expected",
     [
@@ -87,6 +101,15 @@ def test_get_security_vulnerability_database_apis(monkeypatch) -> None:
             ),
             PackageConstraints(package="pystuff", specifiers=["<0.0.1"]),
         ),
+        (
+            SecurityVulnerability(
+                name="CVE-2020-123",
+                identifier="GHSA-1-2-3",
+                package="pystuff",
+                vulnerable_range="> 0.0.1",
+            ),
+            PackageConstraints(package="pystuff", specifiers=[]),
+        ),
     ],
 )
 def test_get_safe_version_constraints(
@@ -109,6 +132,8 @@ def test_get_safe_version_constraints(
         (PackageConstraints(package="pystuff", specifiers=["<1.0.1b1"]), False),
         (PackageConstraints(package="pystuff", specifiers=["<=1.0.2b1deb1"]), False),
         (PackageConstraints(package="pystuff", specifiers=[">banana-peel"]), False),
+        (PackageConstraints(package="pystuff", specifiers=[">=1.2.3"]), True),
+        (PackageConstraints(package="pystuff", specifiers=["<1..2"]), False),
         (PackageConstraints(package="pystuff", specifiers=["==1.2dev0"]), True),
     ],
 )
@@ -164,6 +189,10 @@ def test_fetch_vulnerabilities() -> None:
     assert fetch_vulnerabilities(mock_apis) == mock_vulnerabilities
 
 
+def test_fetch_vulnerabilities__no_apis() -> None:
+    assert fetch_vulnerabilities([]) == []
+
+
 @pytest.mark.parametrize(
     "vulnerabilities, config, expected",
     [
@@ -231,7 +260,7 @@ def test_filter_vulnerabilities(
     expected: List[SecurityVulnerability],
 ) -> None:
     assert (
-        filter_vulnerabilities(config=config, vulnerabilities=vulnerabilities)
+        list(filter_vulnerabilities(config=config, vulnerabilities=vulnerabilities))
         == expected
     )
 
@@ -292,34 +321,34 @@ def test_sort_vulnerabilities(
 
 @freezegun.freeze_time(time_to_freeze=datetime.datetime(1986, 4, 9, 12, 11, 10, 9))
 @pytest.mark.parametrize(
-    "db_names, config, expected",
+    "db_names, config_dict, expected",
     [
         (
             ["FakeDB"],
-            Configuration(),
+            {"ignore_ids": []},
             (
                 "# Generated by security-constraints x.y.z"
-                " on 1986-04-09T12:11:10.000009Z\n"
+                " on 1986-04-09T12:11:10Z\n"
                 "# Data sources: FakeDB\n"
                 r"# Configuration: {'ignore_ids': []}"
             ),
         ),
         (
             ["FakeDB", "Another DB"],
-            Configuration(ignore_ids=["GHSA-1", "GHSA-2"]),
+            {"ignore_ids": ["GHSA-1", "GHSA-2"]},
             (
                 "# Generated by security-constraints x.y.z"
-                " on 1986-04-09T12:11:10.000009Z\n"
+                " on 1986-04-09T12:11:10Z\n"
                 "# Data sources: FakeDB, Another DB\n"
                 r"# Configuration: {'ignore_ids': ['GHSA-1', 'GHSA-2']}"
             ),
         ),
         (
             [],
-            Configuration(),
+            {"ignore_ids": []},
             (
                 "# Generated by security-constraints x.y.z"
-                " on 1986-04-09T12:11:10.000009Z\n"
+                " on 1986-04-09T12:11:10Z\n"
                 "# Data sources: \n"
                 r"# Configuration: {'ignore_ids': []}"
             ),
@@ -327,10 +356,9 @@ def test_sort_vulnerabilities(
     ],
 )
 def test_create_header(
-    monkeypatch, db_names: List[str], config: Configuration, expected: str
+    monkeypatch, db_names: List[str], config_dict: Dict, expected: str
 ):
-    mock_version = Mock(return_value="x.y.z")
-    monkeypatch.setattr("security_constraints.main.version", mock_version)
+    monkeypatch.setattr("security_constraints.main.APP_VERSION", "x.y.z")
     assert (
         create_header(
             [
@@ -340,11 +368,10 @@ def test_create_header(
                 )
                 for db_name in db_names
             ],
-            config,
+            config_dict,
         )
         == expected
     )
-    mock_version.assert_called_once_with("security-constraints")
 
 
 @pytest.mark.parametrize(
@@ -406,7 +433,7 @@ def test_main(monkeypatch, to_stdout: bool) -> None:
     mock_get_args = create_autospec(get_args)
     mock_setup_logging = create_autospec(setup_logging)
     mock_get_config = create_autospec(get_config)
-    mock_yaml_dump = create_autospec(yaml.safe_dump)
+    mock_yaml_dump = create_autospec(yaml.dump)
     mock_get_apis = create_autospec(get_security_vulnerability_database_apis)
     mock_filter_vulnerabilities = create_autospec(filter_vulnerabilities)
     mock_sort_vulnerabilities = create_autospec(sort_vulnerabilities)
@@ -418,7 +445,7 @@ def test_main(monkeypatch, to_stdout: bool) -> None:
     monkeypatch.setattr("security_constraints.main.get_args", mock_get_args)
     monkeypatch.setattr("security_constraints.main.setup_logging", mock_setup_logging)
     monkeypatch.setattr("security_constraints.main.get_config", mock_get_config)
-    monkeypatch.setattr("security_constraints.main.yaml.safe_dump", mock_yaml_dump)
+    monkeypatch.setattr("yaml.dump", mock_yaml_dump)
     monkeypatch.setattr(
         "security_constraints.main.get_security_vulnerability_database_apis",
         mock_get_apis,
@@ -470,7 +497,10 @@ def test_main(monkeypatch, to_stdout: bool) -> None:
     mock_get_config.assert_called_once_with(
         config_file=mock_get_args.return_value.config
     )
-    mock_get_apis.assert_called_once_with()
+    mock_get_apis.assert_called_once_with(
+        severities=mock_get_args.return_value.severities,
+        cache_ttl=mock_get_args.return_value.cache_ttl,
+    )
     mock_fetch_vulnerabilities.assert_called_once_with([mock_api])
     mock_filter_vulnerabilities.assert_called_once_with(
         config=Configuration(ignore_ids=["GHSA-X2", "GHSA-X1"]),
@@ -489,13 +519,15 @@ def test_main(monkeypatch, to_stdout: bool) -> None:
             call(mock_constraints[2], mock_sorted_vulnerabilities[2]),
         ]
     )
-    mock_stream.write.assert_has_calls(
+    mock_create_header.assert_called_once_with(
+        [mock_api], {"ignore_ids": ["GHSA-X2", "GHSA-X1"], "severities": []}
+    )
+    mock_stream.writelines.assert_called_once_with(
         [
-            call("# Fake header\n"),
-            call("constraints-line-1\n"),
-            call("constraints-line-2\n"),
-        ],
-        any_order=False,
+            "# Fake header\n",
+            "constraints-line-1\n",
+            "constraints-line-2\n",
+        ]
     )
     mock_stream.isatty.assert_called_once_with()
     if to_stdout:
@@ -510,12 +542,12 @@ def test_main__dump_config(monkeypatch, to_stdout: bool) -> None:
     mock_get_args = create_autospec(get_args)
     mock_setup_logging = create_autospec(setup_logging)
     mock_get_config = create_autospec(get_config)
-    mock_yaml_dump = create_autospec(yaml.safe_dump)
+    mock_yaml_dump = create_autospec(yaml.dump)
     mock_get_apis = create_autospec(get_security_vulnerability_database_apis)
     monkeypatch.setattr("security_constraints.main.get_args", mock_get_args)
     monkeypatch.setattr("security_constraints.main.setup_logging", mock_setup_logging)
     monkeypatch.setattr("security_constraints.main.get_config", mock_get_config)
-    monkeypatch.setattr("security_constraints.main.yaml.safe_dump", mock_yaml_dump)
+    monkeypatch.setattr("yaml.dump", mock_yaml_dump)
     monkeypatch.setattr(
         "security_constraints.main.get_security_vulnerability_database_apis",
         mock_get_apis,
@@ -531,7 +563,9 @@ def test_main__dump_config(monkeypatch, to_stdout: bool) -> None:
 
     assert exit_code == 0
     mock_yaml_dump.assert_called_once_with(
-        {"ignore_ids": ["GHSA-X2", "GHSA-X1"]}, stream=sys.stdout
+        {"ignore_ids": ["GHSA-X2", "GHSA-X1"], "severities": []},
+        stream=sys.stdout,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
     )
     mock_get_args.assert_called_once_with()
     mock_setup_logging.assert_called_once_with(debug=mock_get_args.return_value.debug)
@@ -540,6 +574,7 @@ def test_main__dump_config(monkeypatch, to_stdout: bool) -> None:
     )
     mock_get_apis.assert_not_called()
     mock_stream.write.assert_not_called()
+    mock_stream.writelines.assert_not_called()
     mock_stream.isatty.assert_called_once_with()
     if to_stdout:
         mock_stream.close.assert_not_called()
@@ -548,18 +583,17 @@ def test_main__dump_config(monkeypatch, to_stdout: bool) -> None:
 
 
 def test_main__version(monkeypatch, capsys) -> None:
-    mock_version = Mock(return_value="x.y.z")
-    monkeypatch.setattr("security_constraints.main.version", mock_version)
+    monkeypatch.setattr("security_constraints.main.APP_VERSION", "x.y.z")
     mock_stream = Mock()
     mock_get_args = create_autospec(get_args)
     mock_setup_logging = create_autospec(setup_logging)
     mock_get_config = create_autospec(get_config)
-    mock_yaml_dump = create_autospec(yaml.safe_dump)
+    mock_yaml_dump = create_autospec(yaml.dump)
     mock_get_apis = create_autospec(get_security_vulnerability_database_apis)
     monkeypatch.setattr("security_constraints.main.get_args", mock_get_args)
     monkeypatch.setattr("security_constraints.main.setup_logging", mock_setup_logging)
     monkeypatch.setattr("security_constraints.main.get_config", mock_get_config)
-    monkeypatch.setattr("security_constraints.main.yaml.safe_dump", mock_yaml_dump)
+    monkeypatch.setattr("yaml.dump", mock_yaml_dump)
     monkeypatch.setattr(
         "security_constraints.main.get_security_vulnerability_database_apis",
         mock_get_apis,
@@ -575,7 +609,6 @@ def test_main__version(monkeypatch, capsys) -> None:
 
     assert exit_code == 0
     out, err = capsys.readouterr()
-    mock_version.assert_called_once_with("security-constraints")
     assert "x.y.z" in out
     assert not err
     mock_yaml_dump.assert_not_called()
@@ -584,6 +617,23 @@ def test_main__version(monkeypatch, capsys) -> None:
     mock_get_config.assert_not_called()
     mock_get_apis.assert_not_called()
     mock_stream.write.assert_not_called()
+    mock_stream.writelines.assert_not_called()
+
+
+@pytest.mark.parametrize("flag", ["-v", "--version"])
+def test_main__version_fast_path(monkeypatch, capsys, flag: str) -> None:
+    monkeypatch.setattr("security_constraints.main.APP_VERSION", "x.y.z")
+    monkeypatch.setattr("sys.argv", ["security-constraints", flag])
+    mock_get_args = create_autospec(get_args)
+    monkeypatch.setattr("security_constraints.main.get_args", mock_get_args)
+
+    exit_code = main()
+
+    assert exit_code == 0
+    out, err = capsys.readouterr()
+    assert out == "x.y.z\n"
+    assert not err
+    mock_get_args.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -597,7 +647,7 @@ def test_main__exception(
     mock_get_args = create_autospec(get_args)
     mock_setup_logging = create_autospec(setup_logging)
     mock_get_config = create_autospec(get_config)
-    mock_yaml_dump = create_autospec(yaml.safe_dump)
+    mock_yaml_dump = create_autospec(yaml.dump)
     mock_get_apis = create_autospec(get_security_vulnerability_database_apis)
     mock_get_apis.side_effect = exception_type("intentional")
     mock_filter_vulnerabilities = create_autospec(filter_vulnerabilities)
@@ -605,7 +655,7 @@ def test_main__exception(
     monkeypatch.setattr("security_constraints.main.get_args", mock_get_args)
     monkeypatch.setattr("security_constraints.main.setup_logging", mock_setup_logging)
     monkeypatch.setattr("security_constraints.main.get_config", mock_get_config)
-    monkeypatch.setattr("security_constraints.main.yaml.safe_dump", mock_yaml_dump)
+    monkeypatch.setattr("yaml.dump", mock_yaml_dump)
     monkeypatch.setattr(
         "security_constraints.main.get_security_vulnerability_database_apis",
         mock_get_apis,
@@ -629,12 +679,36 @@ def test_main__exception(
     mock_get_config.assert_called_once_with(
         config_file=mock_get_args.return_value.config
     )
-    mock_get_apis.assert_called_once_with()
+    mock_get_apis.assert_called_once_with(
+        severities=mock_get_args.return_value.severities,
+        cache_ttl=mock_get_args.return_value.cache_ttl,
+    )
     mock_filter_vulnerabilities.assert_not_called()
     mock_stream.write.assert_not_called()
+    mock_stream.writelines.assert_not_called()
     mock_stream.isatty.assert_called_once_with()
 
 
+def test_main__cache_ttl(monkeypatch, tmp_path) -> None:
+    output_file: Path = tmp_path / "constraints.txt"
+    monkeypatch.setattr(
+        "sys.argv",
+        ["security-constraints", "--cache-ttl", "600", "--output", str(output_file)],
+    )
+    mock_get_apis = create_autospec(get_security_vulnerability_database_apis)
+    mock_get_apis.return_value = []
+    monkeypatch.setattr(
+        "security_constraints.main.get_security_vulnerability_database_apis",
+        mock_get_apis,
+    )
+
+    exit_code = main()
+
+    assert exit_code == 0
+    mock_get_apis.assert_called_once_with(severities=["critical"], cache_ttl=600)
+    assert output_file.read_text().startswith("# Generated by security-constraints")
+
+
 def test_main__output_none_exception(monkeypatch) -> None:
     mock_get_args = create_autospec(get_args)
     mock_get_args.return_value.version = False